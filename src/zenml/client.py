@@ -3927,9 +3927,13 @@ class Client(metaclass=ClientMetaClass):
             config=config,
             source=source,
         )
-        return self.zen_store.create_code_repository(
+        response = self.zen_store.create_code_repository(
             code_repository=repo_request
         )
+        # Invalidate previously cached lookups (including negative results)
+        # so the new repository is considered when resolving sources.
+        source_utils.clear_code_repository_cache()
+        return response
 
     def list_code_repositories(
         self,
@@ -4016,9 +4020,11 @@ class Client(metaclass=ClientMetaClass):
             name_id_or_prefix=name_id_or_prefix, allow_name_prefix_match=False
         )
         update = CodeRepositoryUpdateModel(name=repo.name)  # type: ignore[call-arg]
-        return self.zen_store.update_code_repository(
+        response = self.zen_store.update_code_repository(
             code_repository_id=repo.id, update=update
         )
+        source_utils.clear_code_repository_cache()
+        return response
 
     def delete_code_repository(
         self,
@@ -4033,6 +4039,7 @@ class Client(metaclass=ClientMetaClass):
             name_id_or_prefix=name_id_or_prefix, allow_name_prefix_match=False
         )
         self.zen_store.delete_code_repository(code_repository_id=repo.id)
+        source_utils.clear_code_repository_cache()
 
     # ---- utility prefix matching get functions -----
 
@@ -30,6 +30,7 @@ from pydantic import BaseModel, Field, validator
 from zenml.enums import StackComponentType
 from zenml.logger import get_logger
 from zenml.models.base_models import (
+    BaseZenModel,
     ShareableRequestModel,
     ShareableResponseModel,
     update_model,
@@ -68,6 +69,15 @@ class ComponentBaseModel(BaseModel):
         title="The stack component configuration.",
     )
 
+    class Config(BaseZenModel.Config):
+        """Pydantic configuration class."""
+
+        # Don't deep-copy component models when they get validated as fields
+        # of other models. List endpoints can return hundreds of components
+        # and the copies only add heap churn. Only effective on pydantic
+        # >=1.10; older versions interpret this setting as a boolean.
+        copy_on_model_validation = "none"
+
 
 # -------- #
 # RESPONSE #
@@ -169,7 +179,7 @@ class ComponentRequestModel(ComponentBaseModel, ShareableRequestModel):
 
     ANALYTICS_FIELDS: ClassVar[List[str]] = ["type", "flavor"]
 
-    @validator("name")
+    @validator("name", allow_reuse=True)
     def name_cant_be_a_secret_reference(cls, name: str) -> str:
         """Validator to ensure that the given name is not a secret reference.
 
@@ -182,7 +192,9 @@ class ComponentRequestModel(ComponentBaseModel, ShareableRequestModel):
         Raises:
             ValueError: If the name is a secret reference.
         """
-        if secret_utils.is_secret_reference(name):
+        # Cheap guard first: a secret reference always contains `{{`, so
+        # regular names skip the regex check entirely.
+        if "{{" in name and secret_utils.is_secret_reference(name):
             raise ValueError(
                 "Passing the `name` attribute of a stack component as a "
                 "secret reference is not allowed."
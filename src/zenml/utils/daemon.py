@@ -29,6 +29,7 @@ from typing import Any, Callable, Optional, TypeVar, cast
 import psutil
 
 from zenml.logger import get_logger
+from zenml.utils import source_utils
 
 logger = get_logger(__name__)
 
@@ -213,6 +214,10 @@ else:
         os.setsid()
         os.umask(0o22)
 
+        # the source root and everything derived from it may depend on the
+        # working directory, so invalidate the corresponding caches
+        source_utils._invalidate_source_root_cache()
+
         # second fork
         try:
             pid = os.fork()
@@ -13,7 +13,7 @@
 #  permissions and limitations under the License.
 """Pagination utilities."""
 
-from typing import Callable, List, TypeVar
+from typing import Any, Callable, Dict, List, Optional, TypeVar
 
 from zenml.models import (
     BaseResponseModel,
@@ -25,19 +25,25 @@ AnyResponseModel = TypeVar("AnyResponseModel", bound=BaseResponseModel)
 
 def depaginate(
     list_method: Callable[..., Page[AnyResponseModel]],
+    page_size: Optional[int] = None,
 ) -> List[AnyResponseModel]:
     """Depaginate the results from a client or store method that returns pages.
 
     Args:
         list_method: The list method to wrap around.
+        page_size: The page size to request. Larger pages mean fewer
+            client/store round trips to fetch all items. If not given, the
+            default page size of the list method is used.
 
     Returns:
         A list of the corresponding Response Models.
     """
-    page = list_method()
+    kwargs: Dict[str, Any] = {"size": page_size} if page_size else {}
+
+    page = list_method(**kwargs)
     items = list(page.items)
     while page.index < page.total_pages:
-        page = list_method(page=page.index + 1)
+        page = list_method(page=page.index + 1, **kwargs)
         items += list(page.items)
 
     return items
@@ -13,13 +13,14 @@
 #  permissions and limitations under the License.
 """Utilities for loading/resolving objects."""
 import contextlib
+import functools
 import importlib
 import inspect
 import os
 import site
 import sys
-from distutils.sysconfig import get_python_lib
-from pathlib import Path, PurePath
+import sysconfig
+from pathlib import Path
 from types import FunctionType, ModuleType
 from typing import (
     TYPE_CHECKING,
@@ -27,7 +28,10 @@ from typing import (
     Callable,
     Dict,
     Iterator,
+    List,
     Optional,
+    Set,
+    Tuple,
     Type,
     Union,
     cast,
@@ -39,10 +43,13 @@ from zenml.config.source import (
     Source,
     SourceType,
 )
+from zenml.constants import PAGE_SIZE_MAXIMUM
 from zenml.logger import get_logger
 from zenml.utils.pagination_utils import depaginate
 
 if TYPE_CHECKING:
+    from uuid import UUID
+
     from zenml.code_repositories import (
         BaseCodeRepository,
         LocalRepositoryContext,
@@ -51,8 +58,82 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
-_CODE_REPOSITORY_CACHE: Dict[str, "LocalRepositoryContext"] = {}
+# Bound the cache so long-running processes that look up many different
+# paths don't retain repository contexts forever.
+_CODE_REPOSITORY_CACHE_MAX_SIZE = 256
+_CODE_REPOSITORY_CACHE: Dict[str, Optional["LocalRepositoryContext"]] = {}
 _CUSTOM_SOURCE_ROOT: Optional[str] = None
+_SOURCE_ROOT_CACHE: Dict[Tuple[str, Optional[str]], str] = {}
+_SOURCE_TYPE_CACHE: Dict[ModuleType, SourceType] = {}
+_PACKAGES_DIST: Optional[Dict[str, List[str]]] = None
+_LOAD_CACHE: Dict[
+    Tuple[str, SourceType, Optional["UUID"], Optional[str]], Any
+] = {}
+_CHECKED_CODE_REPOSITORY_SOURCES: Set[Tuple[str, "UUID", str]] = set()
+_STDLIB_ROOT: Optional[str] = None
+_SITE_PACKAGE_ROOTS: Optional[Tuple[str, ...]] = None
+
+
+@functools.lru_cache(maxsize=4096)
+def _resolved(path: str) -> str:
+    """Resolve a path to its canonical form, eliminating any symlinks.
+
+    The result is cached as the resolution requires a chain of syscalls
+    and the same paths get classified repeatedly during source resolution.
+
+    Args:
+        path: The path to resolve.
+
+    Returns:
+        The canonical path.
+    """
+    return os.path.realpath(path)
+
+
+@functools.lru_cache(maxsize=8)
+def _source_root_prefix(source_root: str) -> str:
+    """Get the canonical form of a source root.
+
+    The returned prefix includes a trailing path separator.
+
+    Args:
+        source_root: The source root.
+
+    Returns:
+        The canonical source root prefix.
+    """
+    return _resolved(source_root) + os.sep
+
+
+def _get_stdlib_root() -> str:
+    """Get the canonical standard library directory.
+
+    The returned directory includes a trailing path separator.
+
+    Returns:
+        The standard library directory.
+    """
+    global _STDLIB_ROOT
+    if _STDLIB_ROOT is None:
+        _STDLIB_ROOT = _resolved(sysconfig.get_paths()["stdlib"]) + os.sep
+    return _STDLIB_ROOT
+
+
+def _get_site_package_roots() -> Tuple[str, ...]:
+    """Get the canonical site-packages directories.
+
+    Each returned directory includes a trailing path separator.
+
+    Returns:
+        The site-packages directories.
+    """
+    global _SITE_PACKAGE_ROOTS
+    if _SITE_PACKAGE_ROOTS is None:
+        _SITE_PACKAGE_ROOTS = tuple(
+            _resolved(path) + os.sep
+            for path in site.getsitepackages() + [site.getusersitepackages()]
+        )
+    return _SITE_PACKAGE_ROOTS
 
 
 def load(source: Union[Source, str]) -> Any:
@@ -67,6 +148,17 @@ def load(source: Union[Source, str]) -> Any:
     if isinstance(source, str):
         source = Source.from_import_path(source)
 
+    # The source type is part of the key because it affects how the source
+    # is loaded, e.g. whether the source root gets prepended to sys.path.
+    cache_key = (
+        source.import_path,
+        source.type,
+        getattr(source, "repository_id", None),
+        getattr(source, "commit", None),
+    )
+    if cache_key in _LOAD_CACHE:
+        return _LOAD_CACHE[cache_key]
+
     import_root = None
     if source.type == SourceType.CODE_REPOSITORY:
         source = CodeRepositorySource.parse_obj(source)
@@ -100,9 +192,15 @@ def load(source: Union[Source, str]) -> Any:
     else:
         obj = module
 
+    _LOAD_CACHE[cache_key] = obj
     return obj
 
 
+def clear_load_cache() -> None:
+    """Clears the cache of previously loaded sources."""
+    _LOAD_CACHE.clear()
+
+
 def resolve(obj: Union[Type[Any], FunctionType, ModuleType]) -> Source:
     """Resolve an object.
 
@@ -139,23 +237,38 @@ def resolve(obj: Union[Type[Any], FunctionType, ModuleType]) -> Source:
     source_type = get_source_type(module=module)
 
     if source_type == SourceType.USER:
-        local_repo_context = find_active_code_repository()
+        source_root = get_source_root()
+        local_repo_context = find_active_code_repository(path=source_root)
 
         if local_repo_context and not local_repo_context.has_local_changes:
-            module_name = _resolve_module(module)
+            module_name = _resolve_module(module, source_root=source_root)
 
-            source_root = get_source_root()
-            subdir = PurePath(source_root).relative_to(local_repo_context.root)
+            repo_root = local_repo_context.root
+
+            # Plain string arithmetic instead of `PurePath.relative_to(...)`
+            # to avoid the path object allocations in this hot path.
+            if source_root == repo_root:
+                subdirectory = "."
+            elif source_root.startswith(repo_root + os.sep):
+                subdirectory = source_root[len(repo_root) + 1 :].replace(
+                    os.sep, "/"
+                )
+            else:
+                raise RuntimeError(
+                    f"Unable to resolve object `{obj}`. The source root "
+                    f"({source_root}) is outside of the active code "
+                    f"repository ({repo_root})."
+                )
 
             return CodeRepositorySource(
                 repository_id=local_repo_context.code_repository_id,
                 commit=local_repo_context.current_commit,
-                subdirectory=subdir.as_posix(),
+                subdirectory=subdirectory,
                 module=module_name,
                 attribute=attribute_name,
             )
 
-        module_name = _resolve_module(module)
+        module_name = _resolve_module(module, source_root=source_root)
     elif source_type == SourceType.DISTRIBUTION_PACKAGE:
         package_name = _get_package_for_module(module_name=module_name)
         if package_name:
@@ -191,8 +304,13 @@ def get_source_root() -> str:
     Raises:
         RuntimeError: If the main module file can't be found.
     """
+    cache_key = (os.getcwd(), _CUSTOM_SOURCE_ROOT)
+    if cache_key in _SOURCE_ROOT_CACHE:
+        return _SOURCE_ROOT_CACHE[cache_key]
+
     if _CUSTOM_SOURCE_ROOT:
         logger.debug("Using custom source root: %s", _CUSTOM_SOURCE_ROOT)
+        _SOURCE_ROOT_CACHE[cache_key] = _CUSTOM_SOURCE_ROOT
         return _CUSTOM_SOURCE_ROOT
 
     from zenml.client import Client
@@ -200,7 +318,9 @@ def get_source_root() -> str:
     repo_root = Client.find_repository()
     if repo_root:
         logger.debug("Using repository root as source root: %s", repo_root)
-        return str(repo_root.resolve())
+        source_root = str(repo_root.resolve())
+        _SOURCE_ROOT_CACHE[cache_key] = source_root
+        return source_root
 
     main_module = sys.modules.get("__main__")
     if main_module is None:
@@ -219,7 +339,23 @@ def get_source_root() -> str:
     path = Path(main_module.__file__).resolve().parent
 
     logger.debug("Using main module parent directory as source root: %s", path)
-    return str(path)
+    source_root = str(path)
+    _SOURCE_ROOT_CACHE[cache_key] = source_root
+    return source_root
+
+
+def _invalidate_source_root_cache() -> None:
+    """Invalidates the cached source roots.
+
+    This needs to be called whenever anything that the source root computation
+    depends on (e.g. the custom source root or the working directory) changes.
+    """
+    _SOURCE_ROOT_CACHE.clear()
+    # Both the user file classification and the import root used when loading
+    # user sources depend on the source root, so those caches need to be
+    # recomputed as well.
+    _SOURCE_TYPE_CACHE.clear()
+    _LOAD_CACHE.clear()
 
 
 def set_custom_source_root(source_root: Optional[str]) -> None:
@@ -234,6 +370,7 @@ def set_custom_source_root(source_root: Optional[str]) -> None:
     logger.debug("Setting custom source root: %s", source_root)
     global _CUSTOM_SOURCE_ROOT
     _CUSTOM_SOURCE_ROOT = source_root
+    _invalidate_source_root_cache()
 
 
 def set_custom_local_repository(
@@ -277,14 +414,38 @@ def set_custom_local_repository(
         _DownloadedRepositoryContext,
     )
 
-    global _CODE_REPOSITORY_CACHE
-
     path = os.path.abspath(get_source_root())
-    _CODE_REPOSITORY_CACHE[path] = _DownloadedRepositoryContext(
-        code_repository_id=repo.id, root=root, commit=commit
+    _cache_code_repository_context(
+        path=path,
+        context=_DownloadedRepositoryContext(
+            code_repository_id=repo.id, root=root, commit=commit
+        ),
     )
 
 
+def _cache_code_repository_context(
+    path: str, context: Optional["LocalRepositoryContext"]
+) -> None:
+    """Caches the local repository context for a path.
+
+    Evicts the least recently used entry if the cache is full.
+
+    Args:
+        path: The path for which to cache the context.
+        context: The context to cache, or None if there is no active code
+            repository at the path.
+    """
+    if len(_CODE_REPOSITORY_CACHE) >= _CODE_REPOSITORY_CACHE_MAX_SIZE:
+        _CODE_REPOSITORY_CACHE.pop(next(iter(_CODE_REPOSITORY_CACHE)))
+
+    _CODE_REPOSITORY_CACHE[path] = context
+
+
+def clear_code_repository_cache() -> None:
+    """Clears the cache of local repository contexts."""
+    _CODE_REPOSITORY_CACHE.clear()
+
+
 def find_active_code_repository(
     path: Optional[str] = None,
 ) -> Optional["LocalRepositoryContext"]:
@@ -297,17 +458,22 @@ def find_active_code_repository(
     Returns:
         The local repository context active at that path or None.
     """
-    global _CODE_REPOSITORY_CACHE
-    from zenml.client import Client
-    from zenml.code_repositories import BaseCodeRepository
-
-    path = path or get_source_root()
-    path = os.path.abspath(path)
+    path = os.path.abspath(path or get_source_root())
 
     if path in _CODE_REPOSITORY_CACHE:
-        return _CODE_REPOSITORY_CACHE[path]
+        # Re-insert the entry to mark it as most recently used.
+        context = _CODE_REPOSITORY_CACHE.pop(path)
+        _CODE_REPOSITORY_CACHE[path] = context
+        return context
 
-    for model in depaginate(list_method=Client().list_code_repositories):
+    from zenml.client import Client
+    from zenml.code_repositories import BaseCodeRepository
+
+    local_context: Optional["LocalRepositoryContext"] = None
+    for model in depaginate(
+        list_method=Client().list_code_repositories,
+        page_size=PAGE_SIZE_MAXIMUM,
+    ):
         try:
             repo = BaseCodeRepository.from_model(model)
         except Exception:
@@ -318,10 +484,12 @@ def find_active_code_repository(
 
         local_context = repo.get_local_context(path)
         if local_context:
-            _CODE_REPOSITORY_CACHE[path] = local_context
-            return local_context
+            break
 
-    return None
+    # Also cache negative results so repeated lookups for a path without an
+    # active code repository don't query the server again.
+    _cache_code_repository_context(path=path, context=local_context)
+    return local_context
 
 
 def is_internal_module(module_name: str) -> bool:
@@ -333,7 +501,7 @@ def is_internal_module(module_name: str) -> bool:
     Returns:
         True if the module is internal, False otherwise.
     """
-    return module_name.split(".", maxsplit=1)[0] == "zenml"
+    return module_name == "zenml" or module_name.startswith("zenml.")
 
 
 def is_user_file(file_path: str) -> bool:
@@ -346,7 +514,7 @@ def is_user_file(file_path: str) -> bool:
         True if the file is a user file, False otherwise.
     """
     source_root = get_source_root()
-    return Path(source_root) in Path(file_path).resolve().parents
+    return _resolved(file_path).startswith(_source_root_prefix(source_root))
 
 
 def is_standard_lib_file(file_path: str) -> bool:
@@ -359,8 +527,7 @@ def is_standard_lib_file(file_path: str) -> bool:
         True if the file belongs to the Python standard library, False
         otherwise.
     """
-    stdlib_root = get_python_lib(standard_lib=True)
-    return Path(stdlib_root).resolve() in Path(file_path).resolve().parents
+    return _resolved(file_path).startswith(_get_stdlib_root())
 
 
 def is_distribution_package_file(file_path: str, module_name: str) -> bool:
@@ -374,11 +541,8 @@ def is_distribution_package_file(file_path: str, module_name: str) -> bool:
         True if the file/module belongs to a distribution package, False
         otherwise.
     """
-    absolute_file_path = Path(file_path).resolve()
-
-    for path in site.getsitepackages() + [site.getusersitepackages()]:
-        if Path(path).resolve() in absolute_file_path.parents:
-            return True
+    if _resolved(file_path).startswith(_get_site_package_roots()):
+        return True
 
     if _get_package_for_module(module_name=module_name):
         return True
@@ -398,6 +562,27 @@ def get_source_type(module: ModuleType) -> SourceType:
     Args:
         module: The module for which to get the source type.
 
+    Returns:
+        The source type.
+    """
+    # Modules are long-lived singletons kept alive by `sys.modules`, so the
+    # classification is stable and can be cached per module object. The
+    # module itself is used as the key (modules hash by identity) to keep it
+    # alive and prevent a garbage collected module's id from being reused.
+    if module in _SOURCE_TYPE_CACHE:
+        return _SOURCE_TYPE_CACHE[module]
+
+    source_type = _compute_source_type(module=module)
+    _SOURCE_TYPE_CACHE[module] = source_type
+    return source_type
+
+
+def _compute_source_type(module: ModuleType) -> SourceType:
+    """Compute the type of a source.
+
+    Args:
+        module: The module for which to compute the source type.
+
     Returns:
         The source type.
     """
@@ -450,6 +635,14 @@ def _warn_about_potential_source_loading_issues(
     Args:
         source: The code repository source.
     """
+    # Only check (and potentially warn about) each source once per process.
+    # The repository state is unlikely to change between loads, and the
+    # check involves a potentially expensive code repository lookup.
+    key = (source.import_path, source.repository_id, source.commit)
+    if key in _CHECKED_CODE_REPOSITORY_SOURCES:
+        return
+    _CHECKED_CODE_REPOSITORY_SOURCES.add(key)
+
     local_repo = find_active_code_repository()
 
     if not local_repo:
@@ -501,11 +694,15 @@ def _warn_about_potential_source_loading_issues(
         )
 
 
-def _resolve_module(module: ModuleType) -> str:
+def _resolve_module(
+    module: ModuleType, source_root: Optional[str] = None
+) -> str:
     """Resolve a module.
 
     Args:
         module: The module to resolve.
+        source_root: The source root relative to which the module should be
+            resolved. If not given, the current source root is used.
 
     Raises:
         RuntimeError: If the module resolving failed.
@@ -521,12 +718,13 @@ def _resolve_module(module: ModuleType) -> str:
             )
         return module.__name__
 
-    module_file = os.path.abspath(module.__file__)
-    source_root = os.path.abspath(get_source_root())
+    module_file = module.__file__
+    if not os.path.isabs(module_file):
+        module_file = os.path.abspath(module_file)
+    source_root = os.path.abspath(source_root or get_source_root())
 
-    module_source_path = os.path.relpath(module_file, source_root)
-
-    if module_source_path.startswith(os.pardir):
+    root_prefix = source_root + os.path.sep
+    if not module_file.startswith(root_prefix):
         raise RuntimeError(
             f"Unable to resolve module `{module}`. The file from which the "
             f"module was loaded ({module_file}) is outside the source root "
@@ -535,14 +733,14 @@ def _resolve_module(module: ModuleType) -> str:
 
     # Remove the file extension and replace the os-specific path separators
     # with `.` to get the module source
-    module_source_path, file_extension = os.path.splitext(module_source_path)
-    if file_extension != ".py":
+    module_source_path = module_file[len(root_prefix) :]
+    if not module_source_path.endswith(".py"):
         raise RuntimeError(
             f"Unable to resolve module `{module}`. The file from which the "
             f"module was loaded ({module_file}) is not a python file."
         )
 
-    module_source = module_source_path.replace(os.path.sep, ".")
+    module_source = module_source_path[: -len(".py")].replace(os.path.sep, ".")
 
     logger.debug("Resolved module `%s` to `%s`", module, module_source)
 
@@ -563,13 +761,20 @@ def _load_module(
     Returns:
         The imported module.
     """
-    if import_root:
+    module = sys.modules.get(module_name)
+    if module is not None:
+        # The module is already loaded, no need to go through the import
+        # machinery (finder walks and import lock) again.
+        return module
+
+    if import_root and import_root not in sys.path:
         with prepend_python_path(import_root):
             return importlib.import_module(module_name)
     else:
         return importlib.import_module(module_name)
 
 
+@functools.lru_cache(maxsize=None)
 def _get_package_for_module(module_name: str) -> Optional[str]:
     """Get the package name for a module.
 
@@ -579,13 +784,20 @@ def _get_package_for_module(module_name: str) -> Optional[str]:
     Returns:
         The package name or None if no package was found.
     """
-    if sys.version_info < (3, 10):
-        from importlib_metadata import packages_distributions
-    else:
-        from importlib.metadata import packages_distributions
+    global _PACKAGES_DIST
+
+    if _PACKAGES_DIST is None:
+        # Enumerating the installed distributions is expensive and the result
+        # is static for the process lifetime, so it only happens once.
+        if sys.version_info < (3, 10):
+            from importlib_metadata import packages_distributions
+        else:
+            from importlib.metadata import packages_distributions
+
+        _PACKAGES_DIST = dict(packages_distributions())
 
     top_level_module = module_name.split(".", maxsplit=1)[0]
-    package_names = packages_distributions().get(top_level_module, [])
+    package_names = _PACKAGES_DIST.get(top_level_module, [])
 
     if len(package_names) == 1:
         return package_names[0]
@@ -594,6 +806,7 @@ def _get_package_for_module(module_name: str) -> Optional[str]:
     return None
 
 
+@functools.lru_cache(maxsize=None)
 def _get_package_version(package_name: str) -> Optional[str]:
     """Gets the version of a package.
 
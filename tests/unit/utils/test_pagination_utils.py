@@ -0,0 +1,67 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+from typing import Any, List, Tuple
+
+from zenml.models import Page
+from zenml.utils.pagination_utils import depaginate
+
+
+def test_depaginate(sample_code_repo_response_model):
+    """Tests that depaginate fetches and aggregates all pages."""
+    pages = {
+        index: Page(
+            index=index,
+            max_size=1,
+            total_pages=2,
+            total=2,
+            items=[sample_code_repo_response_model],
+        )
+        for index in [1, 2]
+    }
+    calls: List[Tuple[Any, ...]] = []
+
+    def list_method(page: int = 1, **kwargs: Any) -> Page:
+        calls.append((page, kwargs))
+        return pages[page]
+
+    items = depaginate(list_method=list_method)
+    assert items == [
+        sample_code_repo_response_model,
+        sample_code_repo_response_model,
+    ]
+    assert calls == [(1, {}), (2, {})]
+
+
+def test_depaginate_with_custom_page_size(sample_code_repo_response_model):
+    """Tests that depaginate forwards a custom page size to the list
+    method."""
+    pages = {
+        index: Page(
+            index=index,
+            max_size=100,
+            total_pages=2,
+            total=101,
+            items=[sample_code_repo_response_model],
+        )
+        for index in [1, 2]
+    }
+    calls: List[Tuple[Any, ...]] = []
+
+    def list_method(page: int = 1, **kwargs: Any) -> Page:
+        calls.append((page, kwargs))
+        return pages[page]
+
+    depaginate(list_method=list_method, page_size=100)
+    assert calls == [(1, {"size": 100}), (2, {"size": 100})]
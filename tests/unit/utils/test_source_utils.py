@@ -104,6 +104,41 @@ def test_user_source_loading_prepends_source_root(mocker, tmp_path):
     assert source_utils.load(correct_code_repo_source) == 1
 
 
+def test_load_caching(mocker):
+    """Tests that loaded sources are cached."""
+    source_utils.clear_load_cache()
+    mocker.patch.object(
+        source_utils,
+        "get_source_root",
+        return_value=CURRENT_MODULE_PARENT_DIR,
+    )
+    mock_load_module = mocker.patch.object(
+        source_utils, "_load_module", wraps=source_utils._load_module
+    )
+
+    internal_source = Source(
+        module="zenml.client", attribute="Client", type=SourceType.INTERNAL
+    )
+    loaded = source_utils.load(internal_source)
+    assert source_utils.load(internal_source) is loaded
+    mock_load_module.assert_called_once()
+
+    # The source type is part of the cache key, so loading the same import
+    # path with a different type is not a cache hit
+    unknown_source = Source(
+        module="zenml.client", attribute="Client", type=SourceType.UNKNOWN
+    )
+    assert source_utils.load(unknown_source) is loaded
+    assert mock_load_module.call_count == 2
+
+    source_utils.clear_load_cache()
+    assert source_utils.load(internal_source) is loaded
+    assert mock_load_module.call_count == 3
+
+    # Cleanup
+    source_utils.clear_load_cache()
+
+
 def test_basic_source_resolving(mocker):
     """Tests basic source resolving."""
     assert source_utils.resolve(int) == Source(
@@ -262,6 +297,28 @@ def test_setting_a_custom_source_root():
     assert source_utils.get_source_root() == initial_source_root
 
 
+def test_source_root_caching(mocker):
+    """Tests that the source root is cached and invalidated when a custom
+    source root gets set."""
+    mock_find_repository = mocker.patch(
+        "zenml.client.Client.find_repository",
+        return_value=pathlib.Path(CURRENT_MODULE_PARENT_DIR),
+    )
+    source_utils._invalidate_source_root_cache()
+
+    assert source_utils.get_source_root() == CURRENT_MODULE_PARENT_DIR
+    assert source_utils.get_source_root() == CURRENT_MODULE_PARENT_DIR
+    mock_find_repository.assert_called_once()
+
+    source_utils.set_custom_source_root(source_root="custom_source_root")
+    assert source_utils.get_source_root() == "custom_source_root"
+    source_utils.set_custom_source_root(source_root=None)
+    assert source_utils.get_source_root() == CURRENT_MODULE_PARENT_DIR
+
+    # Cleanup
+    source_utils._invalidate_source_root_cache()
+
+
 def test_validating_source_classes(mocker):
     """Tests validating the class of a source."""
     mocker.patch.object(
@@ -381,6 +438,66 @@ def test_finding_active_code_repo(mocker, sample_code_repo_response_model):
     source_utils._CODE_REPOSITORY_CACHE = {}
 
 
+def test_finding_active_code_repo_caches_negative_results(mocker):
+    """Tests that lookups for a path without an active code repository are
+    cached."""
+    source_utils.clear_code_repository_cache()
+    mock_list_repos = mocker.patch(
+        "zenml.client.Client.list_code_repositories",
+        return_value=Page(
+            index=1,
+            max_size=1,
+            total_pages=1,
+            total=0,
+            items=[],
+        ),
+    )
+
+    assert not source_utils.find_active_code_repository()
+    assert not source_utils.find_active_code_repository()
+    mock_list_repos.assert_called_once()
+
+    # Clearing the cache results in a new lookup
+    source_utils.clear_code_repository_cache()
+    assert not source_utils.find_active_code_repository()
+    assert mock_list_repos.call_count == 2
+
+    # Cleanup
+    source_utils.clear_code_repository_cache()
+
+
+def test_code_repository_cache_is_bounded(mocker, tmp_path):
+    """Tests that the code repository cache evicts the least recently used
+    entry once it is full."""
+    source_utils.clear_code_repository_cache()
+    mocker.patch(
+        "zenml.client.Client.list_code_repositories",
+        return_value=Page(
+            index=1,
+            max_size=1,
+            total_pages=1,
+            total=0,
+            items=[],
+        ),
+    )
+    mocker.patch.object(source_utils, "_CODE_REPOSITORY_CACHE_MAX_SIZE", 2)
+
+    path_1, path_2, path_3 = (str(tmp_path / name) for name in ["1", "2", "3"])
+
+    source_utils.find_active_code_repository(path=path_1)
+    source_utils.find_active_code_repository(path=path_2)
+    # Cache hits mark the entry as most recently used
+    source_utils.find_active_code_repository(path=path_1)
+    source_utils.find_active_code_repository(path=path_3)
+
+    assert path_1 in source_utils._CODE_REPOSITORY_CACHE
+    assert path_2 not in source_utils._CODE_REPOSITORY_CACHE
+    assert path_3 in source_utils._CODE_REPOSITORY_CACHE
+
+    source_utils.clear_code_repository_cache()
+    assert not source_utils._CODE_REPOSITORY_CACHE
+
+
 def test_setting_a_custom_active_code_repo(mocker):
     """Tests setting and getting a custom local repo."""
     mock_list_repos = mocker.patch(
@@ -409,3 +526,30 @@ def test_setting_a_custom_active_code_repo(mocker):
 
     # Cleanup
     source_utils._CODE_REPOSITORY_CACHE = {}
+
+
+def test_code_repo_source_issues_checked_only_once(mocker):
+    """Tests that potential loading issues for a code repository source are
+    only checked once per source."""
+    mock_find_repo = mocker.patch.object(
+        source_utils,
+        "find_active_code_repository",
+        return_value=None,
+    )
+    mocker.patch.object(
+        source_utils,
+        "get_source_root",
+        return_value=CURRENT_MODULE_PARENT_DIR,
+    )
+
+    source = CodeRepositorySource(
+        module="test_module_name",
+        type=SourceType.CODE_REPOSITORY,
+        repository_id=uuid4(),
+        commit="commit",
+        subdirectory=".",
+    )
+
+    source_utils._warn_about_potential_source_loading_issues(source=source)
+    source_utils._warn_about_potential_source_loading_issues(source=source)
+    mock_find_repo.assert_called_once()